@@ -1,10 +1,17 @@
 import os
 import json
 import logging
+import math
 import asyncio
 import random
 import re
-from typing import Optional, Dict, Any, Tuple, Union
+import time
+import queue
+import atexit
+import threading
+import weakref
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple, Union, List, Set
 from datetime import datetime
 
 # 3rd party
@@ -13,6 +20,12 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import aiohttp
 
+# Optional HTTP/2 transport (Client(http2=True))
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 # Internal
 from .exceptions import APIError, AuthenticationError, ValidationError, RateLimitError
 
@@ -23,8 +36,348 @@ try:
 except ImportError:
     __version__ = "0.2.5-dev"
 
-# Regex for "domain.event" format
-ACTION_REGEX = re.compile(r"^[a-z0-9_]+(\.[a-z0-9_]+)+$", re.IGNORECASE)
+# Static request headers, built once per process; clients only add Authorization
+_HEADER_TEMPLATE_SYNC = {
+    "Content-Type": "application/json",
+    "User-Agent": f"logvault-python/{__version__}",
+    "X-Client-Version": __version__
+}
+_HEADER_TEMPLATE_ASYNC = {
+    **_HEADER_TEMPLATE_SYNC,
+    "User-Agent": f"logvault-python-async/{__version__}"
+}
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=_json_default, separators=(",", ":")).encode()
+
+# Fast JSON (optional): orjson emits bytes and serializes datetimes natively
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson is stricter than json (e.g. ints beyond 64 bits); don't
+            # drop events that the stdlib encoder can still handle
+            return _json_dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _dumps = _json_dumps
+    _loads = json.loads
+
+def _iso_now(_time_ns=time.time_ns, _gmtime=time.gmtime) -> str:
+    # Default event timestamp: UTC, microsecond precision, "Z" suffix.
+    # Avoids datetime.utcnow() (deprecated in 3.12) and a datetime allocation.
+    seconds, nanos = divmod(_time_ns(), 1_000_000_000)
+    t = _gmtime(seconds)
+    return (
+        f"{t.tm_year:04}-{t.tm_mon:02}-{t.tm_mday:02}"
+        f"T{t.tm_hour:02}:{t.tm_min:02}:{t.tm_sec:02}.{nanos // 1000:06}Z"
+    )
+
+# Transport failures from either sync backend (requests, or httpx when http2=True)
+_TRANSPORT_ERRORS: Tuple[type, ...] = (requests.exceptions.RequestException,)
+if httpx is not None:
+    _TRANSPORT_ERRORS += (httpx.HTTPError,)
+
+# Regex for "domain.event" format (case-insensitive via the character class)
+ACTION_REGEX = re.compile(r"^[A-Za-z0-9_]+(?:\.[A-Za-z0-9_]+)+$")
+_action_match = ACTION_REGEX.match
+
+@lru_cache(maxsize=4096)
+def _action_valid(action: str) -> bool:
+    # Actions come from a small, enum-like set, so repeats skip the regex
+    return _action_match(action) is not None
+
+_MAX_PAYLOAD_BYTES = 1024 * 1024 # 1MB Limit
+
+def _exceeds_payload_limit(message: Optional[str], metadata: Optional[Dict[str, Any]]) -> bool:
+    # Lower bound on the encoded size: a str never shrinks when JSON-encoded,
+    # so obviously oversize events are rejected without running the encoder.
+    size = len(message) if message else 0
+    if metadata:
+        size += sum(len(v) for v in metadata.values() if isinstance(v, str))
+    return size > _MAX_PAYLOAD_BYTES
+
+# Background delivery (Client.log_nowait)
+_QUEUE_MAXSIZE = 10000
+_BATCH_SIZE = 100
+_BATCH_WAIT = 0.2 # Seconds to wait for a batch to fill
+_IDLE_POLL = 1.0 # Seconds an idle worker waits before re-checking for stop
+_CLOSE_TIMEOUT = 5.0 # Seconds close() and interpreter exit wait for queued events
+
+_BATCH_ENVELOPE = len(b'{"events":[]}')
+
+def _split_batch(batch: List[bytes]) -> List[List[bytes]]:
+    # Keep each batch envelope within the same 1MB limit as single events.
+    # Each event is counted with a trailing comma, one more than is sent.
+    chunks: List[List[bytes]] = []
+    chunk: List[bytes] = []
+    size = _BATCH_ENVELOPE
+    for json_payload in batch:
+        if chunk and size + len(json_payload) + 1 > _MAX_PAYLOAD_BYTES:
+            chunks.append(chunk)
+            chunk, size = [], _BATCH_ENVELOPE
+        chunk.append(json_payload)
+        size += len(json_payload) + 1
+    chunks.append(chunk)
+    return chunks
+
+class _Flusher:
+    """
+    Queue and daemon worker behind Client.log_nowait().
+
+    Holds the session's post() but not the Client itself, so a client that
+    is dropped without close() can still be collected; its finalizer calls
+    stop() and the worker exits once the queue has drained.
+    """
+
+    def __init__(self, post: Any, events_url: str, timeout: Tuple[float, float]):
+        self.queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=_QUEUE_MAXSIZE)
+        self._post = post
+        self._events_url = events_url
+        self._batch_url = f"{events_url}:batch"
+        self._timeout = timeout
+        self.batch_supported = True
+        self.stopping = False
+        self.thread = threading.Thread(target=self._run, name="logvault-flusher", daemon=True)
+        _FLUSHERS.add(self)
+        self.thread.start()
+
+    def stop(self) -> None:
+        # Never blocks, so it is safe from a finalizer. The sentinel wakes the
+        # worker right away; if the queue is full it stops once idle instead.
+        self.stopping = True
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        q = self.queue
+        with q.all_tasks_done:
+            return q.all_tasks_done.wait_for(lambda: not q.unfinished_tasks, timeout)
+
+    def close(self, timeout: Optional[float]) -> int:
+        # Stop and wait for the worker; returns how many queued events were
+        # discarded because delivery didn't finish in time
+        self.stop()
+        self.thread.join(timeout)
+        dropped = 0
+        if self.thread.is_alive():
+            # Delivery is stuck; empty the queue so the worker exits after its
+            # current batch instead of sending through a closed session
+            while True:
+                try:
+                    json_payload = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if json_payload is not None:
+                    dropped += 1
+                self.queue.task_done()
+            self.queue.put_nowait(None)
+        return dropped
+
+    def _run(self) -> None:
+        try:
+            self._drain()
+        finally:
+            _FLUSHERS.discard(self)
+
+    def _drain(self) -> None:
+        q = self.queue
+        while True:
+            try:
+                json_payload = q.get(timeout=_IDLE_POLL)
+            except queue.Empty:
+                if self.stopping:
+                    return
+                continue
+            if json_payload is None:
+                q.task_done()
+                return
+            batch = [json_payload]
+            last = False
+            deadline = time.monotonic() + _BATCH_WAIT
+            while len(batch) < _BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    json_payload = q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if json_payload is None:
+                    # Send this last batch, then stop
+                    q.task_done()
+                    last = True
+                    break
+                batch.append(json_payload)
+
+            try:
+                self._send_batch(batch)
+            except Exception as e:
+                logging.error(f"[LogVault] Background delivery failed: {type(e).__name__}")
+            finally:
+                for _ in batch:
+                    q.task_done()
+            if last:
+                return
+
+    def _send_batch(self, batch: List[bytes]) -> None:
+        for chunk in _split_batch(batch):
+            if not (self.batch_supported and self._post_batch(chunk)):
+                self._post_each(chunk)
+
+    def _post_batch(self, chunk: List[bytes]) -> bool:
+        # Events are already encoded; splice them into the envelope as-is
+        body = b'{"events":[' + b",".join(chunk) + b"]}"
+        response = self._post(self._batch_url, data=body, timeout=self._timeout)
+        if response.status_code in (404, 405):
+            # Server has no batch endpoint; fall back to one request per event
+            self.batch_supported = False
+            return False
+        response.raise_for_status()
+        return True
+
+    def _post_each(self, chunk: List[bytes]) -> None:
+        for json_payload in chunk:
+            try:
+                response = self._post(
+                    self._events_url, data=json_payload, timeout=self._timeout
+                )
+                response.raise_for_status()
+            except _TRANSPORT_ERRORS as e:
+                logging.error(f"[LogVault] Background delivery failed: {type(e).__name__}")
+
+# Flushers whose worker is still running, including those of collected clients
+_FLUSHERS: Set["_Flusher"] = set()
+
+@atexit.register
+def _flush_at_exit() -> None:
+    # One bounded wait shared by all workers, so an unreachable API can't
+    # hold up shutdown while the queues drain
+    deadline = time.monotonic() + _CLOSE_TIMEOUT
+    for flusher in list(_FLUSHERS):
+        flusher.flush(timeout=max(deadline - time.monotonic(), 0.0))
+
+# Backoff jitter drawn once at import; clients walk it with their own cursor
+_JITTER = tuple(random.random() for _ in range(1024))
+
+_MAX_RETRY_AFTER = 60.0 # Cap on a server-requested delay, in seconds
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    # Only the delta-seconds form; HTTP-date and non-finite values ("inf",
+    # "nan") fall back to backoff, and long delays are capped
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(seconds):
+        return None
+    return min(max(seconds, 0.0), _MAX_RETRY_AFTER)
+
+# Error statuses mapped to SDK exceptions, checked before raise_for_status()
+_STATUS_EXC = {
+    401: (AuthenticationError, "Invalid API key"),
+    404: (APIError, "Event not found: {event_id}"),
+    422: (ValidationError, "Validation failed: {text}"),
+}
+
+def _raise_for_status(response: Any, event_id: Optional[str] = None) -> None:
+    # 404 only maps to "Event not found" for lookups of a single event ID
+    entry = _STATUS_EXC.get(response.status_code)
+    if entry is not None and (event_id is not None or response.status_code != 404):
+        exc_cls, message = entry
+        raise exc_cls(message.format(event_id=event_id, text=response.text))
+    response.raise_for_status()
+
+@lru_cache(maxsize=None)
+def _shared_adapter(max_retries: int, pool_connections: int, pool_maxsize: int) -> HTTPAdapter:
+    """Return the process-wide adapter for this retry/pool config.
+
+    Sharing the adapter shares its urllib3 connection pool, so short-lived
+    clients still reuse keep-alive connections instead of paying a new TLS
+    handshake per event.
+    """
+    if max_retries:
+        # Retry Strategy: 429, 500, 502, 503, 504
+        retry_strategy: Union[Retry, int] = Retry(
+            total=max_retries,
+            backoff_factor=1, # 1s, 2s, 4s
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"]
+        )
+    else:
+        # Retries disabled: no Retry policy, error statuses come back as-is
+        retry_strategy = 0
+    return HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=False
+    )
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not reuse keep-alive sockets opened by its parent
+    os.register_at_fork(after_in_child=_shared_adapter.cache_clear)
+
+class _HTTP2Session:
+    """
+    Minimal requests.Session stand-in backed by an HTTP/2 httpx.Client.
+
+    Only the calls Client makes are supported. Timeouts and the connection
+    pool are configured once here, and httpx retries connection failures
+    only (no 429/5xx status retries).
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        timeout: Tuple[float, float],
+        max_retries: int,
+        pool_maxsize: int
+    ):
+        connect, read = timeout
+        self.headers = headers
+        self._client = httpx.Client(
+            http2=True,
+            headers=headers,
+            timeout=httpx.Timeout(read, connect=connect),
+            # httpx ignores the client's limits= when a transport is given
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=max_retries,
+                limits=httpx.Limits(
+                    max_connections=pool_maxsize,
+                    max_keepalive_connections=pool_maxsize
+                )
+            )
+        )
+
+    def post(self, url: str, data: bytes, timeout: Any = None) -> "httpx.Response":
+        return self._client.post(url, content=data)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Any = None
+    ) -> "httpx.Response":
+        return self._client.get(url, params=params)
+
+    def close(self) -> None:
+        self._client.close()
 
 class Client:
     def __init__(
@@ -32,10 +385,16 @@ class Client:
         api_key: str,
         base_url: str = "https://api.logvault.eu",
         timeout: Tuple[float, float] = (5.0, 10.0), # Connect, Read
-        max_retries: int = 3
+        max_retries: int = 3,
+        pool_connections: int = 20,
+        pool_maxsize: int = 100,
+        http2: bool = False
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        # Endpoint URLs are invariant per client; build them once
+        self._events_url = f"{self.base_url}/v1/events"
+        self._search_url = f"{self.base_url}/v1/events/search"
         self.timeout = timeout
 
         # Pre-validate Key format
@@ -43,29 +402,33 @@ class Client:
              # We log a warning but don't crash, in case key formats change later
              logging.warning("[LogVault] API key does not start with expected prefix.")
 
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": f"logvault-python/{__version__}",
-            "X-Client-Version": __version__
-        }
-
-        # Setup Robust Session with Retries (Sync)
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
-
-        # Retry Strategy: 429, 500, 502, 503, 504
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=1, # 1s, 2s, 4s
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["POST"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
-
-    def log(
+        self.headers = {**_HEADER_TEMPLATE_SYNC, "Authorization": f"Bearer {self.api_key}"}
+
+        if http2:
+            if httpx is None:
+                raise ImportError(
+                    "http2=True requires httpx: pip install 'logvault[http2]'"
+                )
+            self.session = _HTTP2Session(self.headers, timeout, max_retries, pool_maxsize)
+        else:
+            # Setup Robust Session with Retries (Sync)
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+
+            adapter = _shared_adapter(max_retries, pool_connections, pool_maxsize)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+        # Bind the transport calls once; hot paths skip two attribute lookups
+        self._session_post = self.session.post
+        self._session_get = self.session.get
+
+        # Background delivery is started lazily by the first log_nowait()
+        self._flusher: Optional[_Flusher] = None
+        self._worker_lock = threading.Lock()
+        self._closed = False
+
+    def _build_payload(
         self,
         action: str,
         user_id: Optional[str] = None,
@@ -74,54 +437,193 @@ class Client:
         level: str = "info",
         message: Optional[str] = None,
         timestamp: Optional[datetime] = None
-    ) -> Optional[Dict[str, Any]]:
-
+    ) -> Dict[str, Any]:
         # 1. Validation
-        if not ACTION_REGEX.match(action):
+        if not _action_valid(action):
             raise ValidationError(f"Invalid action format '{action}'. Expected 'domain.event'")
-
+        if _exceeds_payload_limit(message, metadata):
+            raise ValidationError("Payload size exceeds 1MB")
+
+        if timestamp is None:
+            timestamp = _iso_now()
+        elif isinstance(timestamp, datetime):
+            # Format here on both backends: json.dumps would need its default=
+            # fallback, and orjson rejects datetime subclasses (pandas
+            # Timestamp, pendulum DateTime)
+            timestamp = timestamp.isoformat()
+
+        # Only send fields that are set: fewer dict slots and smaller payloads
         payload = {
             "action": action,
-            "user_id": user_id,
-            "resource": resource,
-            "metadata": metadata or {},
             "level": level,
-            "message": message,
-            "timestamp": timestamp.isoformat() if timestamp else datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
+        if user_id is not None:
+            payload["user_id"] = user_id
+        if resource is not None:
+            payload["resource"] = resource
+        if metadata:
+            payload["metadata"] = metadata
+        if message is not None:
+            payload["message"] = message
+        return payload
+
+    def _encode_event(
+        self,
+        action: str,
+        user_id: Optional[str],
+        resource: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        level: str,
+        message: Optional[str],
+        timestamp: Optional[datetime]
+    ) -> Optional[bytes]:
+        payload = self._build_payload(
+            action, user_id, resource, metadata, level, message, timestamp
+        )
 
         # 2. Fail-Safe Serialization
         try:
-            json_payload = json.dumps(payload)
-            if len(json_payload) > 1024 * 1024: # 1MB Limit
-                raise ValidationError("Payload size exceeds 1MB")
+            json_payload = _dumps(payload)
         except (TypeError, ValueError) as e:
-            if isinstance(e, ValidationError): raise e
             # Fail silently to avoid crashing app
             logging.error(f"[LogVault] Serialization failed: {e}")
             return None
+        if len(json_payload) > _MAX_PAYLOAD_BYTES:
+            raise ValidationError("Payload size exceeds 1MB")
+        return json_payload
+
+    def log(
+        self,
+        action: str,
+        user_id: Optional[str] = None,
+        resource: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        level: str = "info",
+        message: Optional[str] = None,
+        timestamp: Optional[datetime] = None
+    ) -> Optional[Dict[str, Any]]:
+        if self._closed:
+            raise APIError("LogVault client is closed")
+
+        json_payload = self._encode_event(
+            action, user_id, resource, metadata, level, message, timestamp
+        )
+        if json_payload is None:
+            return None
 
         # 3. Request (Retries handled by Adapter)
         try:
-            response = self.session.post(
-                f"{self.base_url}/v1/events",
-                data=json_payload, # Use pre-dumped string
+            response = self._session_post(
+                self._events_url,
+                data=json_payload, # Use pre-dumped bytes
                 timeout=self.timeout
             )
 
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-
-            if response.status_code == 422:
-                raise ValidationError(f"Validation failed: {response.text}")
+            _raise_for_status(response)
+            return _loads(response.content)
 
-            response.raise_for_status()
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
+        except (*_TRANSPORT_ERRORS, ValueError) as e:
             # Clean Error Message
             raise APIError(f"LogVault Connection Error: {type(e).__name__}") from e
 
+    def log_nowait(
+        self,
+        action: str,
+        user_id: Optional[str] = None,
+        resource: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        level: str = "info",
+        message: Optional[str] = None,
+        timestamp: Optional[datetime] = None
+    ) -> bool:
+        """
+        Queue an audit event for background delivery and return immediately.
+
+        Events are validated here, then sent in batches by a daemon thread.
+        Delivery errors are logged, not raised. Call flush() or close() to
+        wait for queued events; at interpreter exit they get a few seconds.
+
+        Returns:
+            True if the event was queued, False if it was dropped
+        """
+        json_payload = self._encode_event(
+            action, user_id, resource, metadata, level, message, timestamp
+        )
+        if json_payload is None:
+            return False
+
+        # Under the lock so close() can't slip in between the check and the
+        # put and strand the event behind the worker's stop sentinel
+        with self._worker_lock:
+            if self._closed:
+                logging.warning("[LogVault] Client is closed, dropping event.")
+                return False
+            try:
+                self._ensure_worker().queue.put_nowait(json_payload)
+            except queue.Full:
+                logging.warning("[LogVault] Background queue is full, dropping event.")
+                return False
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every event queued by log_nowait() has been delivered.
+
+        Args:
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Returns:
+            True if the queue drained, False if the timeout expired first
+        """
+        flusher = self._flusher
+        if flusher is None:
+            return True
+        return flusher.flush(timeout)
+
+    def close(self, timeout: Optional[float] = _CLOSE_TIMEOUT) -> None:
+        """
+        Deliver queued events, then release this client's HTTP session.
+
+        The client can't send events afterwards; closing twice is a no-op.
+
+        Args:
+            timeout: Maximum seconds to wait for queued events (None: no
+                limit). Events still queued after that are dropped.
+        """
+        with self._worker_lock:
+            if self._closed:
+                return
+            self._closed = True
+            flusher = self._flusher
+        if flusher is not None:
+            # The worker sends what is already queued, then exits
+            dropped = flusher.close(timeout)
+            if dropped:
+                logging.warning(f"[LogVault] Client closed, dropping {dropped} undelivered events.")
+        if isinstance(self.session, requests.Session):
+            # The adapter and its pool are shared with other clients; detach
+            # it so Session.close() doesn't drop their keep-alive connections
+            self.session.adapters.clear()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _ensure_worker(self) -> _Flusher:
+        # Caller holds _worker_lock
+        flusher = self._flusher
+        if flusher is None:
+            flusher = self._flusher = _Flusher(
+                self._session_post, self._events_url, self.timeout
+            )
+            # Stop the worker if this client is dropped without close()
+            weakref.finalize(self, flusher.stop)
+        return flusher
+
     def list_events(
         self,
         page: int = 1,
@@ -150,21 +652,7 @@ class Client:
         if action:
             params["action"] = action
 
-        try:
-            response = self.session.get(
-                f"{self.base_url}/v1/events",
-                params=params,
-                timeout=self.timeout
-            )
-
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-
-            response.raise_for_status()
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            raise APIError(f"LogVault Connection Error: {type(e).__name__}") from e
+        return self._get(self._events_url, params=params)
 
     def get_event(self, event_id: str) -> Dict[str, Any]:
         """
@@ -176,22 +664,7 @@ class Client:
         Returns:
             Dict with event details
         """
-        try:
-            response = self.session.get(
-                f"{self.base_url}/v1/events/{event_id}",
-                timeout=self.timeout
-            )
-
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            if response.status_code == 404:
-                raise APIError(f"Event not found: {event_id}")
-
-            response.raise_for_status()
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            raise APIError(f"LogVault Connection Error: {type(e).__name__}") from e
+        return self._get(f"{self._events_url}/{event_id}", not_found=event_id)
 
     def verify_event(self, event_id: str) -> Dict[str, Any]:
         """
@@ -203,22 +676,7 @@ class Client:
         Returns:
             Dict with 'valid' (bool) and verification details
         """
-        try:
-            response = self.session.get(
-                f"{self.base_url}/v1/events/{event_id}/verify",
-                timeout=self.timeout
-            )
-
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            if response.status_code == 404:
-                raise APIError(f"Event not found: {event_id}")
-
-            response.raise_for_status()
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            raise APIError(f"LogVault Connection Error: {type(e).__name__}") from e
+        return self._get(f"{self._events_url}/{event_id}/verify", not_found=event_id)
 
     def search_events(
         self,
@@ -238,20 +696,22 @@ class Client:
         if len(query) < 2:
             raise ValidationError("Query must be at least 2 characters")
 
-        try:
-            response = self.session.get(
-                f"{self.base_url}/v1/events/search",
-                params={"q": query, "limit": limit},
-                timeout=self.timeout
-            )
+        return self._get(self._search_url, params={"q": query, "limit": limit})
 
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-
-            response.raise_for_status()
-            return response.json()
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        not_found: Optional[str] = None
+    ) -> Dict[str, Any]:
+        # Shared GET + error translation for the read endpoints.
+        # not_found: event ID to report when a 404 means "no such event"
+        try:
+            response = self._session_get(url, params=params, timeout=self.timeout)
+            _raise_for_status(response, not_found)
+            return _loads(response.content)
 
-        except requests.exceptions.RequestException as e:
+        except (*_TRANSPORT_ERRORS, ValueError) as e:
             raise APIError(f"LogVault Connection Error: {type(e).__name__}") from e
 
 class AsyncClient:
@@ -260,79 +720,107 @@ class AsyncClient:
         api_key: str,
         base_url: str = "https://api.logvault.eu",
         timeout: float = 10.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        connector_limit: int = 100
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        # Endpoint URLs are invariant per client; build them once
+        self._events_url = f"{self.base_url}/v1/events"
+        self._search_url = f"{self.base_url}/v1/events/search"
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_retries = max_retries
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": f"logvault-python-async/{__version__}",
-            "X-Client-Version": __version__
-        }
+        self.headers = {**_HEADER_TEMPLATE_ASYNC, "Authorization": f"Bearer {self.api_key}"}
+        self._connector_limit = connector_limit
         self._session = None
+        self._jitter_cursor = id(self)
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        # Bounded pool + DNS cache so high-concurrency loggers don't exhaust fds
+        connector = aiohttp.TCPConnector(limit=self._connector_limit, ttl_dns_cache=300)
+        return aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=self.timeout,
+            connector=connector
+        )
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        session = self._session
+        if session is None:
+            # Auto-create session if not using context manager
+            session = self._session = self._create_session()
+        return session
 
     async def __aenter__(self):
-        self._session = aiohttp.ClientSession(headers=self.headers, timeout=self.timeout)
+        self._session = self._create_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP session, including auto-created ones."""
         if self._session:
             await self._session.close()
+            self._session = None
 
     async def log(self, action: str, **kwargs):
-        if not self._session:
-            # Auto-create session if not using context manager (but warn user)
-            self._session = aiohttp.ClientSession(headers=self.headers, timeout=self.timeout)
-
         # Validation & Serialization logic (Same as Sync)
-        if not ACTION_REGEX.match(action):
+        if not _action_valid(action):
              raise ValidationError(f"Invalid action format '{action}'")
 
-        payload = {"action": action, **kwargs}
-        if "metadata" not in payload: payload["metadata"] = {}
+        payload = {"action": action}
+        payload.update((k, v) for k, v in kwargs.items() if v is not None)
+        timestamp = payload.get("timestamp")
+        if isinstance(timestamp, datetime):
+            # Same as Client: orjson rejects datetime subclasses
+            payload["timestamp"] = timestamp.isoformat()
 
         try:
-            json_data = payload # aiohttp handles serialization, but we check size?
-            # Ideally verify serializability first:
-            json.dumps(payload)
+            # Serialize ourselves instead of json= so aiohttp's stdlib encoder is bypassed
+            data = _dumps(payload)
         except Exception as e:
              logging.error(f"[LogVault] Serialization failed: {e}")
              return None
 
-        url = f"{self.base_url}/v1/events"
+        session = self._ensure_session()
+        url = self._events_url
         attempt = 0
 
         # Async Retry Loop
         while True:
+            retry_after = None
             try:
-                async with self._session.post(url, json=payload) as response:
-                    if response.status == 200 or response.status == 201:
-                        return await response.json()
+                async with session.post(url, data=data) as response:
+                    status = response.status
+                    if status == 200 or status == 201:
+                        return _loads(await response.read())
 
-                    if response.status == 401:
+                    if status == 401:
                         raise AuthenticationError("Invalid API key")
-                    if response.status == 422:
+                    if status == 422:
                         txt = await response.text()
                         raise ValidationError(f"Validation failed: {txt}")
 
-                    # Retry on 429 or 5xx
-                    if attempt < self.max_retries and (response.status == 429 or response.status >= 500):
-                        raise aiohttp.ClientError(f"Server error {response.status}")
-
-                    # Permanent fail
-                    raise APIError(f"HTTP {response.status}")
+                    # Permanent fail (only 429 and 5xx are retried)
+                    if attempt >= self.max_retries or (status != 429 and status < 500):
+                        raise APIError(f"HTTP {status}")
+                    if status == 429:
+                        retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
 
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                attempt += 1
-                if attempt > self.max_retries:
+                if attempt >= self.max_retries:
                     raise APIError(f"Connection failed after {self.max_retries} retries: {type(e).__name__}") from e
 
+            attempt += 1
+            if retry_after is not None:
+                # Server told us how long to back off
+                delay = retry_after
+            else:
                 # Exponential Backoff + Jitter
-                delay = (2 ** attempt) + (random.randint(0, 1000) / 1000)
-                await asyncio.sleep(delay)
+                self._jitter_cursor += 1
+                delay = (2 ** attempt) + _JITTER[self._jitter_cursor & 1023]
+            await asyncio.sleep(delay)
 
     async def list_events(
         self,
@@ -344,38 +832,32 @@ class AsyncClient:
         """
         List audit events with optional filtering (async).
         """
-        if not self._session:
-            self._session = aiohttp.ClientSession(headers=self.headers, timeout=self.timeout)
-
         params = {"page": page, "page_size": min(page_size, 100)}
         if user_id:
             params["user_id"] = user_id
         if action:
             params["action"] = action
 
-        async with self._session.get(f"{self.base_url}/v1/events", params=params) as response:
+        async with self._ensure_session().get(self._events_url, params=params) as response:
             if response.status == 401:
                 raise AuthenticationError("Invalid API key")
             if response.status != 200:
                 raise APIError(f"HTTP {response.status}")
-            return await response.json()
+            return _loads(await response.read())
 
     async def search_events(self, query: str, limit: int = 20) -> Dict[str, Any]:
         """
         Search audit events using semantic search (async).
         """
-        if not self._session:
-            self._session = aiohttp.ClientSession(headers=self.headers, timeout=self.timeout)
-
         if len(query) < 2:
             raise ValidationError("Query must be at least 2 characters")
 
-        async with self._session.get(
-            f"{self.base_url}/v1/events/search",
+        async with self._ensure_session().get(
+            self._search_url,
             params={"q": query, "limit": limit}
         ) as response:
             if response.status == 401:
                 raise AuthenticationError("Invalid API key")
             if response.status != 200:
                 raise APIError(f"HTTP {response.status}")
-            return await response.json()
+            return _loads(await response.read())
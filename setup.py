@@ -44,9 +44,17 @@ setup(
         "aiohttp>=3.9.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.25.0",
+        ],
         "dev": [
-            "pytest>=7.4.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest>=8.2.0",
+            "pytest-asyncio>=0.24.0",
+            "pytest-mock>=3.6.1",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "mypy>=1.0.0",
         ],
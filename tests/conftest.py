@@ -0,0 +1,26 @@
+"""
+Shared pytest configuration for the LogVault SDK tests
+
+Do not use autospec on requests.Session patches. autospec introspects the
+whole Session class every time the patch starts, which is expensive. The
+default MagicMock replacement is enough for the call assertions these tests
+make, and collection fails if a test module patches requests.Session with
+autospec=True.
+"""
+
+import re
+
+import pytest
+
+_AUTOSPEC_SESSION_PATCH = re.compile(
+    r"patch(?:\.object)?\([^)]*requests\.Session[^)]*autospec\s*=\s*True", re.S
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    for path in {item.path for item in items}:
+        if _AUTOSPEC_SESSION_PATCH.search(path.read_text(encoding="utf-8")):
+            raise pytest.UsageError(
+                f"{path.name}: do not patch requests.Session with autospec=True "
+                "(see tests/conftest.py)"
+            )
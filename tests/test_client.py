@@ -4,9 +4,14 @@ Updated November 2025 to match current implementation
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from types import SimpleNamespace
 import json
+import requests
+
+try:
+    from orjson import loads
+except ImportError:  # orjson is an optional extra
+    from json import loads
 
 from logvault import Client, AsyncClient
 from logvault.exceptions import (
@@ -17,67 +22,131 @@ from logvault.exceptions import (
 )
 
 
-class TestClientInitialization:
-    """Test client initialization"""
+def fake_response(status=200, payload=None, text="", content=None):
+    """Lightweight stand-in for requests.Response"""
+    def raise_for_status():
+        if status >= 400:
+            raise requests.exceptions.HTTPError(f"{status} Error")
 
-    def test_valid_api_key_live(self):
-        """Test initialization with valid live API key"""
-        client = Client("lv_live_abc123")
-        assert client.api_key == "lv_live_abc123"
-        assert client.base_url == "https://api.logvault.eu"
+    return SimpleNamespace(
+        status_code=status,
+        text=text,
+        content=json.dumps(payload or {}).encode() if content is None else content,
+        raise_for_status=raise_for_status
+    )
 
-    def test_valid_api_key_test(self):
-        """Test initialization with valid test API key"""
-        client = Client("lv_test_abc123")
-        assert client.api_key == "lv_test_abc123"
 
-    def test_invalid_api_key_format_warns(self):
-        """Test initialization with invalid format logs warning but doesn't crash"""
-        # Current implementation logs warning but doesn't raise
-        client = Client("invalid_key")
-        assert client.api_key == "invalid_key"
+def last_payload(mock):
+    """Decoded JSON body of the mock's most recent call"""
+    return loads(mock.call_args.kwargs["data"])
 
-    def test_custom_base_url(self):
-        """Test custom base URL"""
-        client = Client("lv_test_abc123", base_url="https://custom.example.com")
-        assert client.base_url == "https://custom.example.com"
 
-    def test_base_url_trailing_slash_removed(self):
-        """Test trailing slash is removed from base URL"""
-        client = Client("lv_test_abc123", base_url="https://example.com/")
-        assert client.base_url == "https://example.com"
+def last_params(mock):
+    """Query params of the mock's most recent call"""
+    return mock.call_args.kwargs["params"]
 
-    def test_custom_timeout(self):
-        """Test custom timeout as tuple"""
-        client = Client("lv_test_abc123", timeout=(3.0, 5.0))
-        assert client.timeout == (3.0, 5.0)
 
-    def test_default_timeout(self):
-        """Test default timeout values"""
-        client = Client("lv_test_abc123")
-        assert client.timeout == (5.0, 10.0)
+@pytest.fixture(scope="module", autouse=True)
+def _patched_session(module_mocker):
+    """Patch the sync transport once for the whole module"""
+    return SimpleNamespace(
+        post=module_mocker.patch("requests.Session.post"),
+        get=module_mocker.patch("requests.Session.get")
+    )
+
 
-    def test_max_retries(self):
-        """Test max retries configuration"""
-        client = Client("lv_test_abc123", max_retries=5)
-        # Retries are configured in the session adapter
+@pytest.fixture(scope="module")
+def client(_patched_session):
+    """Default client shared by tests that don't need custom settings"""
+    return Client("lv_test_abc123")
+
+
+@pytest.fixture
+def mock_post(_patched_session):
+    """Module-wide Session.post mock, reset for this test"""
+    _patched_session.post.reset_mock(return_value=True, side_effect=True)
+    return _patched_session.post
+
+
+@pytest.fixture
+def mock_get(_patched_session):
+    """Module-wide Session.get mock, reset for this test"""
+    _patched_session.get.reset_mock(return_value=True, side_effect=True)
+    return _patched_session.get
+
+
+class TestClientInitialization:
+    """Test client initialization"""
+
+    @pytest.mark.parametrize("kwargs,attr,expected", [
+        ({"api_key": "lv_live_abc123"}, "api_key", "lv_live_abc123"),
+        ({"api_key": "lv_live_abc123"}, "base_url", "https://api.logvault.eu"),
+        ({"api_key": "lv_test_abc123"}, "api_key", "lv_test_abc123"),
+        # An invalid key format logs a warning but doesn't raise
+        ({"api_key": "invalid_key"}, "api_key", "invalid_key"),
+        ({"api_key": "lv_test_abc123", "base_url": "https://custom.example.com"},
+         "base_url", "https://custom.example.com"),
+        ({"api_key": "lv_test_abc123", "base_url": "https://example.com/"},
+         "base_url", "https://example.com"),
+        ({"api_key": "lv_test_abc123", "timeout": (3.0, 5.0)}, "timeout", (3.0, 5.0)),
+        ({"api_key": "lv_test_abc123"}, "timeout", (5.0, 10.0)),
+    ])
+    def test_init(self, kwargs, attr, expected):
+        """Test constructor arguments and their defaults"""
+        with Client(**kwargs) as client:
+            assert getattr(client, attr) == expected
+
+    def test_retries_disabled(self):
+        """Test max_retries=0 mounts an adapter without a status retry policy"""
+        client = Client("lv_test_abc123", max_retries=0)
+        retries = client.session.get_adapter("https://api.logvault.eu").max_retries
+        assert retries.total == 0
+        assert not retries.status_forcelist
+
+    def test_connection_pool_size(self):
+        """Test pool sizing options reach the mounted adapter"""
+        client = Client("lv_test_abc123", pool_connections=5, pool_maxsize=50)
+        adapter = client.session.get_adapter("https://api.logvault.eu")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 50
+        assert adapter._pool_connections == 5
+
+        default = Client("lv_test_abc123").session.get_adapter("https://api.logvault.eu")
+        assert default.poolmanager.connection_pool_kw["maxsize"] == 100
+
+    def test_connection_pool_shared(self):
+        """Test clients with the same config share one adapter"""
+        first = Client("lv_test_abc123")
+        second = Client("lv_test_abc123")
+        other = Client("lv_test_abc123", max_retries=5)
+
+        adapter = first.session.get_adapter("https://api.logvault.eu")
+        assert second.session.get_adapter("https://api.logvault.eu") is adapter
+        assert other.session.get_adapter("https://api.logvault.eu") is not adapter
+        assert other.session.get_adapter("https://api.logvault.eu").max_retries.total == 5
+
+    def test_close_keeps_shared_pool(self, mocker):
+        """Test closing one client leaves the shared adapter mounted elsewhere"""
+        first = Client("lv_test_abc123")
+        second = Client("lv_test_abc123")
+        adapter = second.session.get_adapter("https://api.logvault.eu")
+
+        adapter_close = mocker.patch.object(adapter, "close")
+        first.close()
+        adapter_close.assert_not_called()
+        assert not first.session.adapters
+        assert second.session.get_adapter("https://api.logvault.eu") is adapter
 
 
 class TestLogMethod:
     """Test client.log() method"""
 
-    @patch('requests.Session.post')
-    def test_log_minimal(self, mock_post):
+    def test_log_minimal(self, client, mock_post):
         """Test logging with minimal parameters"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = fake_response(200, {
             "id": "event_123",
             "signature": "abc123"
-        }
-        mock_post.return_value = mock_response
+        })
 
-        client = Client("lv_test_abc123")
         result = client.log(
             action="user.login",
             user_id="user_123"
@@ -87,62 +156,50 @@ class TestLogMethod:
         mock_post.assert_called_once()
 
         # Check payload - uses 'data' not 'json' (pre-serialized)
-        call_args = mock_post.call_args
-        data = call_args[1]['data']
-        payload = json.loads(data)
+        payload = last_payload(mock_post)
         assert payload["action"] == "user.login"
         assert payload["user_id"] == "user_123"
+        # Unset optional fields are omitted rather than sent as null
+        assert "resource" not in payload
+        assert "metadata" not in payload
 
-    @patch('requests.Session.post')
-    def test_log_with_metadata(self, mock_post):
-        """Test logging with metadata"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "event_123"}
-        mock_post.return_value = mock_response
+    def test_log_uses_session_headers(self, client, mock_post):
+        """Test auth is set on the session once, not passed per request"""
+        mock_post.return_value = fake_response(201, {"id": "event_123"})
 
-        client = Client("lv_test_abc123")
-        client.log(
+        client.log(action="user.login", user_id="user_123")
+
+        assert client.session.headers["Authorization"] == "Bearer lv_test_abc123"
+        assert client.session.headers["Content-Type"] == "application/json"
+        assert "headers" not in mock_post.call_args.kwargs
+
+    def test_log_with_metadata(self, client):
+        """Test logging with metadata"""
+        payload = client._build_payload(
             action="user.login",
             user_id="user_123",
             metadata={"ip": "1.2.3.4", "browser": "Chrome"}
         )
 
-        call_args = mock_post.call_args
-        data = call_args[1]['data']
-        payload = json.loads(data)
         assert payload["metadata"]["ip"] == "1.2.3.4"
         assert payload["metadata"]["browser"] == "Chrome"
 
-    @patch('requests.Session.post')
-    def test_log_with_custom_resource(self, mock_post):
+    def test_log_with_custom_resource(self, client):
         """Test logging with custom resource"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "event_123"}
-        mock_post.return_value = mock_response
-
-        client = Client("lv_test_abc123")
-        client.log(
+        payload = client._build_payload(
             action="document.delete",
             user_id="user_123",
             resource="document:456"
         )
 
-        call_args = mock_post.call_args
-        data = call_args[1]['data']
-        payload = json.loads(data)
         assert payload["resource"] == "document:456"
 
-    @patch('requests.Session.post')
-    def test_log_with_timestamp(self, mock_post):
+    def test_log_with_timestamp(self, client, mock_post):
         """Test logging with custom timestamp"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "event_123"}
-        mock_post.return_value = mock_response
+        mock_post.return_value = fake_response(200, {"id": "event_123"})
+
+        from datetime import datetime
 
-        client = Client("lv_test_abc123")
         timestamp = datetime(2025, 1, 1, 12, 0, 0)
         client.log(
             action="user.login",
@@ -150,237 +207,448 @@ class TestLogMethod:
             timestamp=timestamp
         )
 
-        call_args = mock_post.call_args
-        data = call_args[1]['data']
-        payload = json.loads(data)
+        payload = last_payload(mock_post)
         assert payload["timestamp"] == "2025-01-01T12:00:00"
 
-    def test_log_invalid_action_format(self):
+    def test_log_with_datetime_subclass_timestamp(self, client, mock_post):
+        """Test datetime subclasses (e.g. pandas Timestamp) are still sent"""
+        mock_post.return_value = fake_response(200, {"id": "event_123"})
+
+        from datetime import datetime
+
+        class CustomDatetime(datetime):
+            pass
+
+        result = client.log(action="user.login", timestamp=CustomDatetime(2025, 1, 1, 12, 0, 0))
+
+        assert result["id"] == "event_123"
+        assert last_payload(mock_post)["timestamp"] == "2025-01-01T12:00:00"
+
+    def test_serializer_output(self):
+        """Test the JSON backend (orjson or stdlib) emits compact ISO 8601 bytes"""
+        from datetime import datetime
+        from logvault.client import _dumps
+
+        data = _dumps({"timestamp": datetime(2025, 1, 1, 12, 0, 0), "metadata": {1: "a"}})
+        assert data == b'{"timestamp":"2025-01-01T12:00:00","metadata":{"1":"a"}}'
+
+    def test_log_metadata_beyond_orjson(self, client, mock_post):
+        """Test values orjson rejects (ints over 64 bits) fall back to json"""
+        mock_post.return_value = fake_response(200, {"id": "event_123"})
+
+        result = client.log(action="user.login", metadata={"n": 2**70})
+
+        assert result["id"] == "event_123"
+        assert b'"metadata":{"n":1180591620717411303424}' in mock_post.call_args.kwargs["data"]
+
+    def test_log_default_timestamp(self, client):
+        """Test events without a timestamp get the current UTC time"""
+        from datetime import datetime, timezone
+
+        payload = client._build_payload(action="user.login", user_id="user_123")
+
+        sent = datetime.strptime(payload["timestamp"], "%Y-%m-%dT%H:%M:%S.%fZ")
+        assert abs((datetime.now(timezone.utc).replace(tzinfo=None) - sent).total_seconds()) < 60
+
+    def test_log_invalid_action_format(self, client):
         """Test logging with invalid action format raises ValidationError"""
-        client = Client("lv_test_abc123")
-        
-        with pytest.raises(ValidationError, match="Invalid action format"):
+        with pytest.raises(ValidationError) as exc_info:
             client.log(action="invalid", user_id="user_123")
+        assert "Invalid action format" in str(exc_info.value)
+
+    def test_log_payload_too_large(self, client, mock_post):
+        """Test oversize payloads raise ValidationError before any request"""
+        with pytest.raises(ValidationError) as exc_info:
+            client.log(action="user.login", metadata={"blob": "x" * (1024 * 1024 + 1)})
+        assert "exceeds 1MB" in str(exc_info.value)
+        with pytest.raises(ValidationError) as exc_info:
+            client.log(action="user.login", metadata={"rows": ["x" * 1024] * 1024})
+        assert "exceeds 1MB" in str(exc_info.value)
+
+        mock_post.assert_not_called()
+
+    def test_action_format_case_insensitive(self):
+        """Test action validation accepts mixed case without re.IGNORECASE"""
+        from logvault.client import ACTION_REGEX
 
-    def test_log_valid_action_formats(self):
+        assert ACTION_REGEX.match("User.Login")
+        assert ACTION_REGEX.match("auth.LOGIN.success")
+        assert not ACTION_REGEX.match("User")
+
+    def test_action_validation_cached(self, client):
+        """Test repeated actions are answered from the validation cache"""
+        from logvault.client import _action_valid
+
+        _action_valid.cache_clear()
+        for _ in range(3):
+            with pytest.raises(ValidationError):
+                client.log(action="not-an-action")
+
+        info = _action_valid.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_log_valid_action_formats(self, client, mock_post):
         """Test various valid action formats"""
-        client = Client("lv_test_abc123")
-        
-        # These should not raise ValidationError (would fail on network)
+        mock_post.return_value = fake_response(201, {"id": "event_123"})
+
+        # These should not raise ValidationError
         valid_actions = [
             "user.login",
             "auth.login.success",
             "document.create",
             "payment.transaction.completed",
         ]
-        
+
         for action in valid_actions:
-            # Just check validation passes (will fail on network call)
-            try:
-                client.log(action=action, user_id="test")
-            except (APIError, ConnectionError):
-                pass  # Expected - no actual API
+            assert client.log(action=action, user_id="test")["id"] == "event_123"
 
 
 class TestErrorHandling:
     """Test error handling"""
 
-    @patch('requests.Session.post')
-    def test_authentication_error(self, mock_post):
-        """Test 401 raises AuthenticationError"""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
-        mock_post.return_value = mock_response
+    @pytest.mark.parametrize("status,exc,message", [
+        (401, AuthenticationError, "Invalid API key"),
+        (422, ValidationError, "Validation failed"),
+    ])
+    def test_http_error(self, client, mock_post, status, exc, message):
+        """Test 401/422 responses raise typed errors"""
+        mock_post.return_value = fake_response(status, text="Rejected")
 
-        client = Client("lv_test_abc123")
+        with pytest.raises(exc) as exc_info:
+            client.log(action="user.login", user_id="user_123")
+        assert message in str(exc_info.value)
+
+    @pytest.mark.parametrize("method,args", [
+        ("list_events", ()),
+        ("verify_event", ("event_123",)),
+    ])
+    def test_read_validation_error(self, client, mock_get, method, args):
+        """Test 422 from a read endpoint raises ValidationError with the body"""
+        mock_get.return_value = fake_response(422, text="page_size must be positive")
 
-        with pytest.raises(AuthenticationError, match="Invalid API key"):
+        with pytest.raises(ValidationError) as exc_info:
+            getattr(client, method)(*args)
+        assert str(exc_info.value) == "Validation failed: page_size must be positive"
+
+    def test_log_not_found_is_not_event_lookup(self, client, mock_post):
+        """Test a 404 from log() isn't reported as a missing event"""
+        mock_post.return_value = fake_response(404)
+
+        with pytest.raises(APIError) as exc_info:
+            client.log(action="user.login", user_id="user_123")
+        assert "Connection Error" in str(exc_info.value)
+
+    @pytest.mark.parametrize("side_effect", [
+        requests.exceptions.Timeout("timeout"),
+        requests.exceptions.ConnectionError("Failed to connect"),
+    ])
+    def test_network_error(self, client, mock_post, side_effect):
+        """Test timeouts and connection failures raise APIError"""
+        mock_post.side_effect = side_effect
+
+        with pytest.raises(APIError) as exc_info:
             client.log(action="user.login", user_id="user_123")
+        assert "Connection Error" in str(exc_info.value)
+
+    def test_malformed_response_body(self, client, mock_get):
+        """Test undecodable response body raises APIError"""
+        mock_get.return_value = fake_response(200, content=b"<html>Bad Gateway</html>")
+
+        with pytest.raises(APIError) as exc_info:
+            client.list_events()
+        assert "Connection Error" in str(exc_info.value)
+
+
+class TestHTTP2Transport:
+    """Test the opt-in HTTP/2 transport"""
+
+    def test_http2_log(self, mocker):
+        """Test log() goes through httpx with HTTP/2 enabled"""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+
+        client = Client("lv_test_abc123", http2=True)
+        assert isinstance(client.session._client, httpx.Client)
+
+        response = httpx.Response(
+            201,
+            content=b'{"id": "event_123"}',
+            request=httpx.Request("POST", "https://api.logvault.eu/v1/events")
+        )
+        mock_post = mocker.patch.object(httpx.Client, "post", return_value=response)
+        result = client.log(action="user.login", user_id="user_123")
+
+        assert result["id"] == "event_123"
+        assert loads(mock_post.call_args.kwargs["content"])["action"] == "user.login"
+
+    def test_http2_errors_become_api_errors(self, mocker):
+        """Test httpx transport failures are wrapped in APIError"""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+
+        client = Client("lv_test_abc123", http2=True)
+        mocker.patch.object(httpx.Client, "get", side_effect=httpx.ConnectError("down"))
+        with pytest.raises(APIError) as exc_info:
+            client.list_events()
+        assert "Connection Error" in str(exc_info.value)
+
+    def test_http2_pool_size(self):
+        """Test pool_maxsize reaches the HTTP/2 transport's connection pool"""
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+
+        with Client("lv_test_abc123", http2=True, pool_maxsize=7) as client:
+            pool = client.session._client._transport._pool
+            assert pool._max_connections == 7
+            assert pool._max_keepalive_connections == 7
 
-    @patch('requests.Session.post')
-    def test_validation_error(self, mock_post):
-        """Test 422 raises ValidationError"""
-        mock_response = Mock()
-        mock_response.status_code = 422
-        mock_response.text = "Invalid action format"
-        mock_post.return_value = mock_response
+    def test_http2_close(self):
+        """Test the context manager closes the httpx client"""
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
 
+        with Client("lv_test_abc123", http2=True) as client:
+            pass
+        assert client.session._client.is_closed
+
+
+class TestLogNowaitMethod:
+    """Test client.log_nowait() background delivery"""
+
+    def test_log_nowait_batches_events(self, mock_post):
+        """Test queued events are sent as one batch on flush"""
+        mock_post.return_value = fake_response(200)
+
+        with Client("lv_test_abc123") as client:
+            assert client.log_nowait(action="user.login", user_id="user_1")
+            assert client.log_nowait(action="user.logout", user_id="user_2")
+            client.flush()
+
+        mock_post.assert_called_once()
+        assert mock_post.call_args.args[0] == "https://api.logvault.eu/v1/events:batch"
+        payload = last_payload(mock_post)
+        assert [e["action"] for e in payload["events"]] == ["user.login", "user.logout"]
+
+    def test_log_nowait_falls_back_without_batch_endpoint(self, mock_post):
+        """Test events are sent one by one when the batch endpoint is missing"""
+        mock_post.side_effect = [fake_response(404), fake_response(201), fake_response(201)]
+
+        with Client("lv_test_abc123") as client:
+            client.log_nowait(action="user.login")
+            client.log_nowait(action="user.logout")
+            client.flush()
+
+        assert mock_post.call_count == 3
+        assert mock_post.call_args.args[0] == "https://api.logvault.eu/v1/events"
+        assert client._flusher.batch_supported is False
+
+    def test_log_nowait_validates_immediately(self):
+        """Test invalid actions raise before being queued"""
         client = Client("lv_test_abc123")
 
-        with pytest.raises(ValidationError, match="Validation failed"):
-            client.log(action="user.login", user_id="user_123")
+        with pytest.raises(ValidationError) as exc_info:
+            client.log_nowait(action="invalid")
+        assert "Invalid action format" in str(exc_info.value)
+        assert client._flusher is None
 
-    @patch('requests.Session.post')
-    def test_timeout_error(self, mock_post):
-        """Test timeout raises APIError"""
-        import requests
-        mock_post.side_effect = requests.exceptions.Timeout("timeout")
+    def test_split_batch_counts_envelope(self):
+        """Test split chunks stay within 1MB including the batch envelope"""
+        from logvault.client import _split_batch, _MAX_PAYLOAD_BYTES
 
-        client = Client("lv_test_abc123", timeout=(1, 1))
+        # Two events that fit only if the envelope is ignored
+        event = b"x" * ((_MAX_PAYLOAD_BYTES - 2) // 2)
+        chunks = _split_batch([event, event])
 
-        with pytest.raises(APIError, match="Connection Error"):
-            client.log(action="user.login", user_id="user_123")
+        assert len(chunks) == 2
+        for chunk in chunks:
+            assert len(b'{"events":[' + b",".join(chunk) + b"]}") <= _MAX_PAYLOAD_BYTES
+
+    def test_close_stops_worker(self, mock_post):
+        """Test close() delivers queued events and ends the worker thread"""
+        from logvault.client import _FLUSHERS
+
+        mock_post.return_value = fake_response(200)
+
+        with Client("lv_test_abc123") as client:
+            client.log_nowait(action="user.login")
+            flusher = client._flusher
+            assert flusher in _FLUSHERS
 
-    @patch('requests.Session.post')
-    def test_connection_error(self, mock_post):
-        """Test connection error raises APIError"""
-        import requests
-        mock_post.side_effect = requests.exceptions.ConnectionError("Failed to connect")
+        assert not flusher.thread.is_alive()
+        assert flusher not in _FLUSHERS
+        assert [e["action"] for e in last_payload(mock_post)["events"]] == ["user.login"]
 
+    def test_closed_client_rejects_events(self, mock_post):
+        """Test events logged after close() are refused, not sent"""
         client = Client("lv_test_abc123")
+        client.close()
+        client.close()
 
-        with pytest.raises(APIError, match="Connection Error"):
-            client.log(action="user.login", user_id="user_123")
+        assert client.log_nowait(action="user.login") is False
+        with pytest.raises(APIError) as exc_info:
+            client.log(action="user.login")
+        assert "closed" in str(exc_info.value)
+        mock_post.assert_not_called()
+
+    def test_close_during_log_nowait(self, mock_post, mocker):
+        """Test an event racing close() is refused rather than stranded"""
+        mock_post.return_value = fake_response(200)
+
+        client = Client("lv_test_abc123")
+        assert client.log_nowait(action="user.login")
+        encode = client._encode_event
+
+        def encode_then_close(*args):
+            json_payload = encode(*args)
+            client.close()
+            return json_payload
+
+        mocker.patch.object(client, "_encode_event", side_effect=encode_then_close)
+        assert client.log_nowait(action="user.logout") is False
+        assert client.flush(timeout=1)
+        assert mock_post.call_count == 1
+
+    def test_dropped_client_stops_worker(self, mock_post):
+        """Test an unclosed client is collected and its worker drains and exits"""
+        import gc
+        import weakref
+
+        mock_post.return_value = fake_response(200)
+
+        client = Client("lv_test_abc123")
+        client.log_nowait(action="user.login")
+        flusher = client._flusher
+        client_ref = weakref.ref(client)
+        del client
+        gc.collect()
+
+        assert client_ref() is None
+        flusher.thread.join(timeout=5)
+        assert not flusher.thread.is_alive()
+        assert [e["action"] for e in last_payload(mock_post)["events"]] == ["user.login"]
+
+    def test_close_timeout_drops_stuck_events(self, mock_post, caplog):
+        """Test close(timeout=...) gives up on stuck delivery and reports drops"""
+        import threading
+
+        posting, release = threading.Event(), threading.Event()
+
+        def stuck_post(*args, **kwargs):
+            posting.set()
+            release.wait()
+            return fake_response(200)
+
+        mock_post.side_effect = stuck_post
+
+        client = Client("lv_test_abc123")
+        client.log_nowait(action="user.login")
+        assert posting.wait(timeout=5)
+        client.log_nowait(action="user.logout")
+        client.log_nowait(action="user.logout")
+
+        client.close(timeout=0.05)
+        assert "dropping 2 undelivered events" in caplog.text
+
+        release.set()
+        client._flusher.thread.join(timeout=5)
+        assert not client._flusher.thread.is_alive()
+        assert mock_post.call_count == 1
+
+    def test_flush_timeout(self, mock_post):
+        """Test flush(timeout=...) gives up while delivery is still stuck"""
+        import threading
+
+        release = threading.Event()
+        mock_post.side_effect = lambda *args, **kwargs: release.wait() and fake_response(200)
+
+        with Client("lv_test_abc123") as client:
+            client.log_nowait(action="user.login")
+            assert client.flush(timeout=0.05) is False
+
+            release.set()
+            assert client.flush(timeout=5) is True
 
 
 class TestListEventsMethod:
     """Test client.list_events() method"""
 
-    @patch('requests.Session.get')
-    def test_list_events_default(self, mock_get):
+    def test_list_events_default(self, client, mock_get):
         """Test listing events with default parameters"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_get.return_value = fake_response(200, {
             "events": [{"id": "event_1"}, {"id": "event_2"}],
             "total": 2,
             "page": 1,
             "page_size": 50,
             "has_next": False
-        }
-        mock_get.return_value = mock_response
+        })
 
-        client = Client("lv_test_abc123")
         result = client.list_events()
 
         assert len(result["events"]) == 2
         assert result["total"] == 2
         mock_get.assert_called_once()
 
-    @patch('requests.Session.get')
-    def test_list_events_with_filters(self, mock_get):
-        """Test listing events with filters"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "events": [{"id": "event_1"}],
-            "total": 1,
-            "page": 1,
-            "page_size": 50,
-            "has_next": False
-        }
-        mock_get.return_value = mock_response
-
-        client = Client("lv_test_abc123")
-        result = client.list_events(user_id="user_123", action="user.login")
-
-        assert len(result["events"]) == 1
-        
-        # Check query params
-        call_args = mock_get.call_args
-        params = call_args[1]['params']
-        assert params["user_id"] == "user_123"
-        assert params["action"] == "user.login"
-
-    @patch('requests.Session.get')
-    def test_list_events_pagination(self, mock_get):
-        """Test listing events with pagination"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "events": [],
-            "total": 100,
-            "page": 2,
-            "page_size": 25,
-            "has_next": True
-        }
-        mock_get.return_value = mock_response
-
-        client = Client("lv_test_abc123")
-        result = client.list_events(page=2, page_size=25)
-
-        call_args = mock_get.call_args
-        params = call_args[1]['params']
-        assert params["page"] == 2
-        assert params["page_size"] == 25
+    @pytest.mark.parametrize("kwargs,expected_params", [
+        ({"user_id": "user_123", "action": "user.login"},
+         {"page": 1, "page_size": 50, "user_id": "user_123", "action": "user.login"}),
+        ({"page": 2, "page_size": 25}, {"page": 2, "page_size": 25}),
+        ({"page_size": 500}, {"page": 1, "page_size": 100}),  # Capped
+    ])
+    def test_list_events_params(self, client, mock_get, kwargs, expected_params):
+        """Test filters and pagination are sent as query params"""
+        mock_get.return_value = fake_response(200, {"events": [], "total": 0})
 
-    @patch('requests.Session.get')
-    def test_list_events_max_page_size(self, mock_get):
-        """Test page_size is capped at 100"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"events": [], "total": 0}
-        mock_get.return_value = mock_response
+        client.list_events(**kwargs)
 
-        client = Client("lv_test_abc123")
-        client.list_events(page_size=500)
-
-        call_args = mock_get.call_args
-        params = call_args[1]['params']
-        assert params["page_size"] == 100  # Capped
+        assert last_params(mock_get) == expected_params
 
 
 class TestSearchEventsMethod:
     """Test client.search_events() method"""
 
-    @patch('requests.Session.get')
-    def test_search_events(self, mock_get):
+    def test_search_events(self, client, mock_get):
         """Test searching events"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_get.return_value = fake_response(200, {
             "results": [{"id": "event_1", "action": "user.login"}],
             "count": 1,
             "has_embeddings": True
-        }
-        mock_get.return_value = mock_response
+        })
 
-        client = Client("lv_test_abc123")
         result = client.search_events("failed login")
 
         assert result["count"] == 1
         assert result["has_embeddings"] is True
 
-    def test_search_events_short_query(self):
+    def test_search_events_short_query(self, client):
         """Test search with too short query raises ValidationError"""
-        client = Client("lv_test_abc123")
-        
-        with pytest.raises(ValidationError, match="at least 2 characters"):
+        with pytest.raises(ValidationError) as exc_info:
             client.search_events("a")
+        assert "at least 2 characters" in str(exc_info.value)
 
 
 class TestVerifyEventMethod:
     """Test client.verify_event() method"""
 
-    @patch('requests.Session.get')
-    def test_verify_event(self, mock_get):
+    def test_verify_event(self, client, mock_get):
         """Test verifying an event"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_get.return_value = fake_response(200, {
             "valid": True,
             "event_id": "event_123",
             "signature": "abc123"
-        }
-        mock_get.return_value = mock_response
+        })
 
-        client = Client("lv_test_abc123")
         result = client.verify_event("event_123")
 
         assert result["valid"] is True
+        assert mock_get.call_args.args[0] == "https://api.logvault.eu/v1/events/event_123/verify"
 
-    @patch('requests.Session.get')
-    def test_verify_event_not_found(self, mock_get):
+    def test_verify_event_not_found(self, client, mock_get):
         """Test verifying non-existent event"""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        mock_get.return_value = fake_response(404)
 
-        client = Client("lv_test_abc123")
-
-        with pytest.raises(APIError, match="not found"):
+        with pytest.raises(APIError) as exc_info:
             client.verify_event("nonexistent")
+        assert str(exc_info.value) == "Event not found: nonexistent"
 
 
 class TestAsyncClient:
@@ -398,9 +666,122 @@ class TestAsyncClient:
         client = AsyncClient("invalid_key")
         assert client.api_key == "invalid_key"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_async_context_manager(self):
         """Test async client as context manager"""
         async with AsyncClient("lv_test_abc123") as client:
             assert client.api_key == "lv_test_abc123"
             assert client._session is not None
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_async_connector_limit(self):
+        """Test async session uses a bounded connector and close() releases it"""
+        client = AsyncClient("lv_test_abc123", connector_limit=10)
+        async with client:
+            assert client._session.connector.limit == 10
+        assert client._session is None
+        await client.close()  # Idempotent
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_async_log_honors_retry_after(self, mocker):
+        """Test 429 responses are retried after the server's Retry-After delay"""
+        rate_limited = SimpleNamespace(status=429, headers={"Retry-After": "7"})
+        created = SimpleNamespace(
+            status=201, read=mocker.AsyncMock(return_value=b'{"id": "event_123"}')
+        )
+
+        session = mocker.MagicMock()
+        session.post.return_value.__aenter__.side_effect = [rate_limited, created]
+
+        client = AsyncClient("lv_test_abc123")
+        client._session = session
+        mock_sleep = mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+        result = await client.log("user.login", user_id="user_123")
+
+        assert result["id"] == "event_123"
+        assert session.post.call_count == 2
+        mock_sleep.assert_awaited_once_with(7.0)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_async_log_retries_server_errors(self, mocker):
+        """Test 5xx responses are retried with backoff instead of raising"""
+        unavailable = SimpleNamespace(status=503, headers={})
+        created = SimpleNamespace(
+            status=201, read=mocker.AsyncMock(return_value=b'{"id": "event_123"}')
+        )
+        session = mocker.MagicMock()
+        session.post.return_value.__aenter__.side_effect = [unavailable, created]
+
+        client = AsyncClient("lv_test_abc123")
+        client._session = session
+        mock_sleep = mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+        result = await client.log("user.login", user_id="user_123")
+
+        assert result["id"] == "event_123"
+        assert session.post.call_count == 2
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.parametrize("max_retries", [0, 2])
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_async_log_gives_up_after_max_retries(self, mocker, max_retries):
+        """Test persistent 5xx raises APIError after max_retries + 1 attempts"""
+        session = mocker.MagicMock()
+        session.post.return_value.__aenter__.return_value = SimpleNamespace(
+            status=503, headers={}
+        )
+
+        client = AsyncClient("lv_test_abc123", max_retries=max_retries)
+        client._session = session
+        mock_sleep = mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+        with pytest.raises(APIError) as exc_info:
+            await client.log("user.login", user_id="user_123")
+
+        assert str(exc_info.value) == "HTTP 503"
+        assert session.post.call_count == max_retries + 1
+        assert mock_sleep.await_count == max_retries
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_async_log_datetime_subclass_timestamp(self, mocker):
+        """Test datetime subclasses (e.g. pandas Timestamp) are still sent"""
+        from datetime import datetime
+
+        class CustomDatetime(datetime):
+            pass
+
+        created = SimpleNamespace(
+            status=201, read=mocker.AsyncMock(return_value=b'{"id": "event_123"}')
+        )
+        session = mocker.MagicMock()
+        session.post.return_value.__aenter__.return_value = created
+
+        client = AsyncClient("lv_test_abc123")
+        client._session = session
+        result = await client.log(
+            "user.login", timestamp=CustomDatetime(2025, 1, 1, 12, 0, 0)
+        )
+
+        assert result["id"] == "event_123"
+        assert loads(session.post.call_args.kwargs["data"])["timestamp"] == "2025-01-01T12:00:00"
+
+    @pytest.mark.parametrize("value,expected", [
+        ("7", 7.0),
+        ("-3", 0.0),
+        ("86400", 60.0),  # Capped
+        ("inf", None),
+        ("nan", None),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", None),
+        (None, None),
+    ])
+    def test_retry_after_parsing(self, value, expected):
+        """Test Retry-After values are bounded; unusable ones fall back to backoff"""
+        from logvault.client import _retry_after_seconds
+
+        assert _retry_after_seconds(value) == expected
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_async_session_created_once(self):
+        """Test the session is auto-created on first use and then reused"""
+        client = AsyncClient("lv_test_abc123")
+        session = client._ensure_session()
+        assert client._ensure_session() is session
+        await client.close()